@@ -7,15 +7,22 @@ from pathlib import Path
 
 # === PATHS ===
 BASE_DIR = Path(__file__).parent.parent
-TEMPLATE_PATH = BASE_DIR / "templates" / "template.png"
+TEMPLATES_DIR = BASE_DIR / "templates"
+TEMPLATE_PATH = TEMPLATES_DIR / "template.png"
 QUOTES_CSV_PATH = BASE_DIR / "data" / "quotes.csv"
 OUTPUT_DIR = BASE_DIR / "output"
 FONTS_DIR = BASE_DIR / "fonts"
+CACHE_DIR = BASE_DIR / "cache"                 # Sprites de dates pré-rendus
+SESSIONS_DIR = BASE_DIR / "sessions"           # Sessions instagrapi (secret!)
 
 # === FONTS (Arabe) ===
 FONT_QUOTE = FONTS_DIR / "Amiri-Bold.ttf"       # Police arabe pour citations
 FONT_DATE = FONTS_DIR / "Amiri-Bold.ttf"     # Police arabe pour date
 
+# === SHAPING ARABE ===
+# "auto" = raqm (natif Pillow) si disponible, sinon arabic_reshaper
+SHAPING_BACKEND = "auto"
+
 # === TEXT POSITIONING ===
 TEXT_CONFIG = {
     "quote": {
@@ -25,17 +32,67 @@ TEXT_CONFIG = {
         "max_width": 35,             # Caractères par ligne
         "line_spacing": 20,          # Plus d'espace pour l'arabe
         "rtl": True,                  # Right-to-Left pour l'arabe
-        "shadow_color": None,
+        "shadow_color": None,        # None = pas de calque d'ombre
         "shadow_offset": 0,
+        "shadow_blur": 0,            # Rayon du flou de l'ombre
+        "outline_color": None,       # None = pas de contour
+        "outline_width": 0,
     },
     "date": {
         "position": (540, 200),      # Centre-bas (changé pour RTL)
         "font_size": 60,
         "color": "#169485",
-        "rtl": True
+        "rtl": True,
+        "shadow_color": "#000000",
+        "shadow_offset": 2,
     }
 }
 
+# === FORMATS D'EXPORT ===
+# Les positions de TEXT_CONFIG sont données pour ce format de référence
+REFERENCE_SIZE = (1080, 1080)
+
+# Ancres en fractions de l'image (x, y) - indépendantes de la résolution
+# Utilisées seulement si le template du format existe; sinon le template
+# carré est centré sur la nouvelle taille et TEXT_CONFIG est décalé d'autant.
+# Au format de référence, TEXT_CONFIG fait foi (feed == generate()).
+def _reference_anchor(key: str) -> tuple:
+    x, y = TEXT_CONFIG[key]["position"]
+    return (x / REFERENCE_SIZE[0], y / REFERENCE_SIZE[1])
+
+
+EXPORT_FORMATS = {
+    "feed": {
+        "size": REFERENCE_SIZE,
+        "template": TEMPLATE_PATH,
+        "quote": _reference_anchor("quote"),
+        "date": _reference_anchor("date"),
+    },
+    "portrait": {
+        "size": (1080, 1350),
+        "template": TEMPLATES_DIR / "template_portrait.png",
+        "quote": (0.5, 0.46),
+        "date": (0.5, 0.2),
+    },
+    "story": {
+        "size": (1080, 1920),
+        "template": TEMPLATES_DIR / "template_story.png",
+        "quote": (0.5, 0.5),
+        "date": (0.5, 0.25),     # Sous la zone masquée par l'interface
+    },
+}
+
+# === REEL / STORY (vidéo) ===
+REEL_CONFIG = {
+    "fps": 30,
+    "duration": 8.0,                 # Secondes (minimum)
+    "hold": 2.0,                     # Pause après la dernière ligne
+    "fade": 0.6,                     # Durée du fondu de chaque élément
+    "line_delay": 0.8,               # Décalage entre deux lignes
+    "start": 0.3,                    # Avant l'apparition de la date
+    "crf": 20,                       # Qualité x264 (plus bas = meilleur)
+}
+
 # === INSTAGRAM ===
 HASHTAGS = """
 #تنمية_ذاتية #تطوير_الذات #اقتباسات #حكم
@@ -43,6 +100,9 @@ HASHTAGS = """
 #اقتباسات_عربية #حكمة_اليوم
 """
 
+# Durée de réutilisation d'une session sauvegardée (secondes)
+SESSION_TTL = 24 * 60 * 60
+
 # === IMAGE SETTINGS ===
 IMAGE_QUALITY = 95
 IMAGE_FORMAT = "PNG"
\ No newline at end of file
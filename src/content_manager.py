@@ -75,6 +75,18 @@ class ContentManager:
         
         return None
     
+    def get_backlog(self, limit: int = None) -> list:
+        """Get missed quotes (date <= today, not posted), oldest first"""
+        missed = self.df[(self.df["posted"] == False) & (self.df["date"] <= date.today())]
+        missed = missed.sort_values("date")
+        if limit is not None:
+            missed = missed.head(limit)
+        
+        return [
+            {"date": row["date"], "content": row["content"], "index": index}
+            for index, row in missed.iterrows()
+        ]
+    
     def mark_as_posted(self, index: int):
         """Mark a quote as posted and save CSV"""
         self.df.at[index, "posted"] = True
@@ -0,0 +1,96 @@
+"""
+Cache des bandeaux de date pré-rendus
+Une année de masques alpha par thème, stockée en .npy et lue en mmap
+"""
+
+import hashlib
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from PIL import Image
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import CACHE_DIR
+
+
+class DateSpriteCache:
+    def __init__(self, build: Callable[[date], tuple], theme: tuple,
+                 cache_dir: Path = CACHE_DIR):
+        """
+        Args:
+            build: Fonction date -> (masque "L", (x, y)) utilisée pour pré-rendre
+            theme: Tout ce qui change le masque (police et son fichier, taille,
+                position, textes des dates...) - haché dans le nom du cache
+            cache_dir: Dossier des sprites
+        """
+        self.build = build
+        self.theme_key = hashlib.sha1(repr(theme).encode()).hexdigest()[:10]
+        self.cache_dir = cache_dir
+        self._years = {}
+
+    def _paths(self, year: int) -> tuple:
+        stem = f"dates_{year}_{self.theme_key}"
+        return self.cache_dir / f"{stem}.npy", self.cache_dir / f"{stem}_index.npy"
+
+    def _build_year(self, year: int):
+        """Pré-rend les 365/366 dates de l'année et les écrit sur disque"""
+        print(f"🗓️  Pré-rendu des dates {year}...")
+        first = date(year, 1, 1)
+        days = (date(year + 1, 1, 1) - first).days
+
+        sprites = [self.build(first + timedelta(days=i)) for i in range(days)]
+
+        # Masques concaténés à plat + index (décalage, x, y, largeur, hauteur)
+        index = np.zeros((days, 5), dtype=np.int64)
+        offset = 0
+        for i, (mask, (x, y)) in enumerate(sprites):
+            index[i] = (offset, x, y, mask.width, mask.height)
+            offset += mask.width * mask.height
+        strip = np.concatenate(
+            [np.asarray(mask).ravel() for mask, _ in sprites]
+        ).astype(np.uint8, copy=False)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for path, array in zip(self._paths(year), (strip, index)):
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, path)
+        print(f"✅ {days} dates en cache ({strip.nbytes // 1024} Ko)")
+
+    def _load_year(self, year: int) -> tuple:
+        if year not in self._years:
+            strip_path, index_path = self._paths(year)
+            if not (strip_path.exists() and index_path.exists()):
+                self._build_year(year)
+            self._years[year] = (
+                np.load(strip_path, mmap_mode="r"),
+                np.load(index_path),
+            )
+        return self._years[year]
+
+    def get(self, quote_date: date) -> tuple:
+        """Retourne (masque, (x, y)) pour la date, depuis le cache"""
+        strip, index = self._load_year(quote_date.year)
+        i = quote_date.timetuple().tm_yday - 1
+        offset, x, y, width, height = (int(v) for v in index[i])
+        pixels = strip[offset:offset + width * height].reshape(height, width)
+        mask = Image.fromarray(np.array(pixels))
+        return mask, (x, y)
+
+    def warm(self, year: int):
+        """Force la construction du cache pour une année"""
+        self._load_year(year)
+
+
+# === PRÉ-RENDU ===
+if __name__ == "__main__":
+    from image_generator import ImageGenerator
+
+    year = int(sys.argv[1]) if len(sys.argv) > 1 else date.today().year
+    generator = ImageGenerator(use_date_cache=True)
+    generator.date_cache.warm(year)
@@ -3,48 +3,80 @@ Generates Instagram images with Arabic text (RTL support)
 Optimisé pour le public tunisien - VERSION FINALE
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageOps
 from datetime import date
 from pathlib import Path
 import sys
 
-# Support RTL arabe
-try:
-    import arabic_reshaper
-    # On n'utilise PAS bidi avec Pillow!
-    print("✅ Support arabe activé")
-except ImportError as e:
-    raise ImportError(f"Installez: pip install arabic-reshaper\nErreur: {e}")
-
 sys.path.append(str(Path(__file__).parent.parent))
 from config import (
     TEMPLATE_PATH, FONT_QUOTE, FONT_DATE, 
-    OUTPUT_DIR, TEXT_CONFIG, IMAGE_QUALITY, FONTS_DIR
+    OUTPUT_DIR, TEXT_CONFIG, IMAGE_QUALITY, FONTS_DIR,
+    EXPORT_FORMATS, REFERENCE_SIZE
 )
+from text_renderer import TextRenderer
+from shaping import get_backend
+from date_sprites import DateSpriteCache
+
+TUNISIAN_MONTHS = {
+    1: "جانفي", 2: "فيفري", 3: "مارس", 4: "أفريل",
+    5: "ماي", 6: "جوان", 7: "جويلية", 8: "أوت",
+    9: "سبتمبر", 10: "أكتوبر", 11: "نوفمبر", 12: "ديسمبر"
+}
+
+ARABIC_DAYS = {
+    0: "الإثنين", 1: "الثلاثاء", 2: "الأربعاء", 3: "الخميس",
+    4: "الجمعة", 5: "السبت", 6: "الأحد"
+}
+
+
+def format_tunisian_date(quote_date: date) -> str:
+    """Ex: الإثنين 19 جانفي 2026"""
+    day_name = ARABIC_DAYS[quote_date.weekday()]
+    return f"{day_name} {quote_date.day} {TUNISIAN_MONTHS[quote_date.month]} {quote_date.year}"
 
 
 class ImageGenerator:
-    def __init__(self, template_path: Path = TEMPLATE_PATH):
+    def __init__(self, template_path: Path = TEMPLATE_PATH,
+                 use_date_cache: bool = False):
         self.template_path = template_path
         self.quote_config = TEXT_CONFIG["quote"]
         self.date_config = TEXT_CONFIG["date"]
         
+        # Support RTL arabe: raqm natif ou arabic_reshaper
+        self.shaper = get_backend()
+        print(f"✅ Support arabe activé ({self.shaper.name})")
+        
         print("🔤 Chargement des polices...")
-        self.font_quote = ImageFont.truetype(str(FONT_QUOTE), self.quote_config["font_size"])
-        self.font_date = ImageFont.truetype(str(FONT_DATE), self.date_config["font_size"])
+        self.font_quote = self.shaper.font(FONT_QUOTE, self.quote_config["font_size"])
+        self.font_date = self.shaper.font(FONT_DATE, self.date_config["font_size"])
         print("✅ Polices chargées")
+        
+        self.renderer = TextRenderer()
+        self._scaled_templates = {}
+        
+        # Cache des dates pré-rendues (utile pour le rendu en lot)
+        self.date_cache = None
+        if use_date_cache:
+            font_stat = FONT_DATE.stat()
+            theme = (
+                FONT_DATE.name, font_stat.st_size, font_stat.st_mtime_ns,
+                self.date_config["font_size"], self.shaper.name,
+                self.date_config["position"],
+                self.renderer.padding_for(self.date_config),
+                # Les textes eux-mêmes: noms des mois/jours et format
+                TUNISIAN_MONTHS, ARABIC_DAYS, format_tunisian_date(date(2000, 1, 1)),
+            )
+            self.date_cache = DateSpriteCache(self._rasterize_date, theme)
     
     def _reshape_arabic(self, text: str) -> str:
         """
-        Reshape le texte arabe - SANS bidi pour Pillow
-        Pillow gère déjà le RTL en interne
+        Prépare le texte arabe pour Pillow selon le backend actif
         """
-        # Seulement reshaper pour connecter les lettres
-        reshaped = arabic_reshaper.reshape(text)
-        # NE PAS utiliser get_display() - Pillow gère le RTL
-        return reshaped
+        return self.shaper.shape(text)
     
-    def _wrap_text_simple(self, text: str, max_chars: int = 45) -> list:
+    @staticmethod
+    def _wrap_text_simple(text: str, max_chars: int = 45) -> list:
         """
         Découpe le texte en lignes par nombre de caractères
         Plus simple et plus fiable pour l'arabe
@@ -77,14 +109,7 @@ class ImageGenerator:
         """
         print(f"📝 Texte original: {quote_text[:50]}...")
         
-        img = Image.open(self.template_path).copy()
-        draw = ImageDraw.Draw(img)
-        
-        # Dessiner la citation
-        self._draw_quote(draw, quote_text)
-        
-        # Dessiner la date
-        self._draw_date(draw, quote_date)
+        img = self.render(quote_text, quote_date)
         
         # Sauvegarder
         if output_filename is None:
@@ -98,8 +123,147 @@ class ImageGenerator:
         
         return output_path
     
-    def _draw_quote(self, draw: ImageDraw.ImageDraw, text: str):
-        """Dessine la citation arabe centrée"""
+    def layout(self, quote_text: str, quote_date: date) -> list:
+        """Rastérise la citation et la date -> liste de (masque, origine, style)"""
+        return [
+            self._quote_block(quote_text),
+            self._date_block(quote_date),
+        ]
+    
+    def render(self, quote_text: str, quote_date: date,
+               blocks: list = None, scale: float = 1.0) -> Image.Image:
+        """
+        Compose l'image en mémoire, sans l'enregistrer
+        
+        Args:
+            blocks: Résultat de layout() s'il a déjà été calculé
+            scale: < 1 pour un aperçu basse résolution (template et blocs
+                   réduits avant la composition)
+        """
+        if blocks is None:
+            blocks = self.layout(quote_text, quote_date)
+        
+        if scale == 1:
+            return self.renderer.composite(Image.open(self.template_path), blocks)
+        
+        # Template réduit gardé en mémoire pour les rendus en lot
+        if scale not in self._scaled_templates:
+            img = Image.open(self.template_path)
+            size = (round(img.width * scale), round(img.height * scale))
+            self._scaled_templates[scale] = img.resize(size, Image.LANCZOS)
+        
+        scaled = [
+            None if block is None else self._scale_block(*block, scale)
+            for block in blocks
+        ]
+        return self.renderer.composite(self._scaled_templates[scale], scaled)
+    
+    def generate_formats(self, quote_text: str, quote_date: date,
+                         formats: list = None) -> dict:
+        """
+        Génère la même publication en plusieurs formats (feed, portrait, story)
+        
+        La mise en page (reshape, découpage, mesures, rastérisation) est faite
+        une seule fois, relativement aux ancres de TEXT_CONFIG, puis placée
+        sur le template de chaque format.
+        
+        Returns:
+            {nom du format: chemin de l'image}
+        """
+        print(f"📝 Texte original: {quote_text[:50]}...")
+        formats = formats or list(EXPORT_FORMATS)
+        
+        # Blocs décalés par rapport à leur ancre (pixels du format de référence)
+        layout = {}
+        for key, block in (
+            ("quote", self._quote_block(quote_text)),
+            ("date", self._date_block(quote_date)),
+        ):
+            if block is None:
+                continue
+            mask, (x, y), style = block
+            ax, ay = TEXT_CONFIG[key]["position"]
+            layout[key] = (mask, (x - ax, y - ay), style)
+        
+        outputs = {}
+        for name in formats:
+            fmt = EXPORT_FORMATS[name]
+            width, height = fmt["size"]
+            template, scale, anchors = self._format_canvas(fmt)
+            
+            blocks = []
+            for key, (mask, (dx, dy), style) in layout.items():
+                if scale != 1:
+                    mask, (dx, dy), style = self._scale_block(mask, (dx, dy), style, scale)
+                ax, ay = anchors[key]
+                blocks.append((mask, (ax + dx, ay + dy), style))
+            
+            img = self.renderer.composite(template, blocks)
+            
+            output_path = OUTPUT_DIR / f"post_{quote_date.strftime('%Y%m%d')}_{name}.png"
+            OUTPUT_DIR.mkdir(exist_ok=True)
+            img.save(output_path, quality=IMAGE_QUALITY)
+            print(f"🖼️  {name} ({width}x{height}): {output_path}")
+            outputs[name] = output_path
+        
+        return outputs
+    
+    def _format_canvas(self, fmt: dict) -> tuple:
+        """
+        Template du format -> (image, échelle, {bloc: ancre en pixels})
+        
+        Avec un template dédié, les ancres fractionnaires du format sont
+        utilisées. À défaut, le template carré est centré sur la nouvelle
+        taille et le texte garde ses positions TEXT_CONFIG, décalées d'autant.
+        """
+        width, height = fmt["size"]
+        
+        if fmt["template"].exists():
+            img = Image.open(fmt["template"])
+            if img.size != fmt["size"]:
+                img = img.resize(fmt["size"], Image.LANCZOS)
+            if fmt["size"] == REFERENCE_SIZE:
+                anchors = {key: TEXT_CONFIG[key]["position"] for key in ("quote", "date")}
+            else:
+                anchors = {
+                    key: (round(fmt[key][0] * width), round(fmt[key][1] * height))
+                    for key in ("quote", "date")
+                }
+            return img, width / REFERENCE_SIZE[0], anchors
+        
+        # Même résultat qu'ImageOps.pad, mais avec le décalage connu
+        square = Image.open(self.template_path)
+        content = ImageOps.contain(square, fmt["size"])
+        offset = ((width - content.width) // 2, (height - content.height) // 2)
+        img = Image.new(content.mode, fmt["size"], square.getpixel((0, 0)))
+        img.paste(content, offset)
+        
+        scale = content.width / REFERENCE_SIZE[0]
+        anchors = {
+            key: (
+                round(TEXT_CONFIG[key]["position"][0] * scale) + offset[0],
+                round(TEXT_CONFIG[key]["position"][1] * scale) + offset[1],
+            )
+            for key in ("quote", "date")
+        }
+        return img, scale, anchors
+    
+    @staticmethod
+    def _scale_block(mask: Image.Image, offset: tuple, style: dict, scale: float) -> tuple:
+        """Adapte un bloc déjà rastérisé à un format d'une autre largeur"""
+        size = (max(1, round(mask.width * scale)), max(1, round(mask.height * scale)))
+        scaled_style = dict(style)
+        for key in ("shadow_offset", "shadow_blur", "outline_width"):
+            if style.get(key):
+                scaled_style[key] = round(style[key] * scale)
+        return (
+            mask.resize(size, Image.LANCZOS),
+            (round(offset[0] * scale), round(offset[1] * scale)),
+            scaled_style,
+        )
+    
+    def _layout_quote(self, text: str) -> list:
+        """Découpe et centre la citation -> liste de (ligne, (x, y))"""
         config = self.quote_config
         
         # Découper en lignes
@@ -110,6 +274,7 @@ class ImageGenerator:
         total_height = len(lines) * line_height
         start_y = config["position"][1] - (total_height // 2)
         
+        placed = []
         for i, line in enumerate(lines):
             # Reshaper SEULEMENT (pas de bidi)
             display_line = self._reshape_arabic(line)
@@ -120,41 +285,35 @@ class ImageGenerator:
             line_width = bbox[2] - bbox[0]
             x = config["position"][0] - (line_width // 2)
             y = start_y + (i * line_height)
-            
-            # Ombre
-            draw.text(
-                (x + config["shadow_offset"], y + config["shadow_offset"]),
-                display_line,
-                font=self.font_quote,
-                fill=config["shadow_color"]
-            )
-            
-            # Texte
-            draw.text(
-                (x, y),
-                display_line,
-                font=self.font_quote,
-                fill=config["color"]
-            )
+            placed.append((display_line, (x, y)))
+        
+        return placed
+    
+    def _quote_block(self, text: str) -> tuple:
+        """Rastérise la citation arabe centrée -> (masque, origine, style) ou None si vide"""
+        config = self.quote_config
+        raster = self.renderer.rasterize(
+            self._layout_quote(text), self.font_quote,
+            padding=self.renderer.padding_for(config)
+        )
+        if raster is None:
+            return None
+        mask, origin = raster
+        return mask, origin, config
     
-    def _draw_date(self, draw: ImageDraw.ImageDraw, quote_date: date):
-        """Dessine la date en style tunisien"""
+    def _date_block(self, quote_date: date) -> tuple:
+        """Bandeau de date en style tunisien -> (masque, origine, style)"""
+        if self.date_cache is not None:
+            mask, origin = self.date_cache.get(quote_date)
+        else:
+            print(f"📅 Date: {format_tunisian_date(quote_date)}")
+            mask, origin = self._rasterize_date(quote_date)
+        return mask, origin, self.date_config
+    
+    def _rasterize_date(self, quote_date: date) -> tuple:
+        """Rastérise la date centrée -> (masque, origine)"""
         config = self.date_config
-        
-        tunisian_months = {
-            1: "جانفي", 2: "فيفري", 3: "مارس", 4: "أفريل",
-            5: "ماي", 6: "جوان", 7: "جويلية", 8: "أوت",
-            9: "سبتمبر", 10: "أكتوبر", 11: "نوفمبر", 12: "ديسمبر"
-        }
-        
-        arabic_days = {
-            0: "الإثنين", 1: "الثلاثاء", 2: "الأربعاء", 3: "الخميس",
-            4: "الجمعة", 5: "السبت", 6: "الأحد"
-        }
-        
-        day_name = arabic_days[quote_date.weekday()]
-        date_text = f"{day_name} {quote_date.day} {tunisian_months[quote_date.month]} {quote_date.year}"
-        print(f"📅 Date: {date_text}")
+        date_text = format_tunisian_date(quote_date)
         
         display_date = self._reshape_arabic(date_text)
         
@@ -163,9 +322,10 @@ class ImageGenerator:
         x = config["position"][0] - (text_width // 2)
         y = config["position"][1]
         
-        draw.text((x + 2, y + 2), display_date, font=self.font_date, fill="#000000")
-        draw.text((x, y), display_date, font=self.font_date, fill=config["color"])
-
+        return self.renderer.rasterize(
+            [(display_date, (x, y))], self.font_date,
+            padding=self.renderer.padding_for(config)
+        )
 
 if __name__ == "__main__":
     generator = ImageGenerator()
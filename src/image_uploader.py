@@ -17,6 +17,8 @@ class GitHubImageUploader:
         
         if not self.token:
             raise ValueError("Missing GH_TOKEN!")
+        
+        self._uploaded = set()
     
     def upload(self, image_path: Path) -> str:
         """
@@ -36,6 +38,11 @@ class GitHubImageUploader:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"images/post_{timestamp}.png"
         
+        # Back-to-back uploads (pipelined backfill) can share a second
+        if filename in self._uploaded:
+            filename = f"images/post_{timestamp}_{len(self._uploaded)}.png"
+        self._uploaded.add(filename)
+        
         # Upload via GitHub API
         url = f"https://api.github.com/repos/{self.repo}/contents/{filename}"
         
@@ -12,6 +12,9 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config import HASHTAGS
 
+# Seconds Instagram needs between container creation and publishing
+PROCESSING_WAIT = 5
+
 
 class InstagramGraphAPI:
     def __init__(self):
@@ -24,20 +27,15 @@ class InstagramGraphAPI:
         if not self.instagram_id:
             raise ValueError("Missing IG_BUSINESS_ID!")
     
-    def post_image(self, image_url: str, caption: str) -> str:
+    def create_container(self, image_url: str, caption: str) -> str:
         """
-        Post image to Instagram using Graph API
-        
-        Args:
-            image_url: Public URL of the image (must be accessible online)
-            caption: Post caption with hashtags
+        Create the media container (Instagram starts processing the image)
         
         Returns:
-            Media ID of posted content
+            Creation ID to pass to publish_container()
         """
         print("📤 Creating media container...")
         
-        # Step 1: Create media container
         create_url = f"{self.base_url}/{self.instagram_id}/media"
         
         create_response = requests.post(create_url, data={
@@ -52,11 +50,15 @@ class InstagramGraphAPI:
         creation_id = create_response.json()["id"]
         print(f"✅ Media container created: {creation_id}")
         
-        # Step 2: Wait for processing
-        print("⏳ Waiting for Instagram to process image...")
-        time.sleep(5)
+        return creation_id
+    
+    def publish_container(self, creation_id: str) -> str:
+        """
+        Publish a processed media container
         
-        # Step 3: Publish the media
+        Returns:
+            Media ID of posted content
+        """
         print("📱 Publishing to Instagram...")
         publish_url = f"{self.base_url}/{self.instagram_id}/media_publish"
         
@@ -73,6 +75,27 @@ class InstagramGraphAPI:
         
         return media_id
     
+    def post_image(self, image_url: str, caption: str) -> str:
+        """
+        Post image to Instagram using Graph API
+        
+        Args:
+            image_url: Public URL of the image (must be accessible online)
+            caption: Post caption with hashtags
+        
+        Returns:
+            Media ID of posted content
+        """
+        # Step 1: Create media container
+        creation_id = self.create_container(image_url, caption)
+        
+        # Step 2: Wait for processing
+        print("⏳ Waiting for Instagram to process image...")
+        time.sleep(PROCESSING_WAIT)
+        
+        # Step 3: Publish the media
+        return self.publish_container(creation_id)
+    
     def post_with_retry(self, image_url: str, caption: str, 
                         max_retries: int = 3) -> str:
         """Post with automatic retry"""
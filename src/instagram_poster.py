@@ -1,9 +1,11 @@
 """
 Updated Instagram Poster with Session Support
+Sessions are persisted to disk and reused across posts and retries
 """
 
 import os
 import json
+import time
 from pathlib import Path
 from instagrapi import Client
 from instagrapi.exceptions import LoginRequired
@@ -11,14 +13,22 @@ import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from config import HASHTAGS
+from session_store import SessionStore
 
 
-class InstagramPoster:
-    def __init__(self):
-        self.client = Client()
+# One client per account, shared by every InstagramPoster in the process
+_CLIENTS = {}
+_LOGGED_IN_AT = {}
+_SESSION_SOURCE = {}
+
+
+def _get_client(username: str) -> Client:
+    """Return the pooled client for an account, creating it on first use"""
+    if username not in _CLIENTS:
+        client = Client()
         
         # Set device settings to look more legitimate
-        self.client.set_device({
+        client.set_device({
             "app_version": "269.0.0.18.75",
             "android_version": 26,
             "android_release": "8.0.0",
@@ -32,36 +42,75 @@ class InstagramPoster:
         })
         
         # Add delays to seem more human
-        self.client.delay_range = [1, 3]
+        client.delay_range = [1, 3]
+        _CLIENTS[username] = client
+    
+    return _CLIENTS[username]
+
+
+class InstagramPoster:
+    def __init__(self, store: SessionStore = None):
+        self.username = os.environ.get("IG_USERNAME")
+        self.password = os.environ.get("IG_PASSWORD")
+        self.store = store or SessionStore()
+        self.account = self.username or "default"
+        self.client = _get_client(self.account)
+        
+        # Session sources Instagram rejected during this run
+        self.rejected = set()
     
-    def login(self):
+    def _session_is_fresh(self) -> bool:
+        logged_in_at = _LOGGED_IN_AT.get(self.account)
+        return logged_in_at is not None and time.time() - logged_in_at < self.store.ttl
+    
+    def _on_login(self, source: str, persist: bool = False):
         """
-        Login using pre-created session (from your local machine)
-        Falls back to username/password if no session
+        Remember the login. Only persist settings Instagram has actually
+        validated: a reused session keeps its original saved_at until
+        post() saves it after a successful upload.
         """
-        username = os.environ.get("IG_USERNAME")
-        password = os.environ.get("IG_PASSWORD")
+        _LOGGED_IN_AT[self.account] = time.time()
+        _SESSION_SOURCE[self.account] = source
+        if persist and self.username:
+            self.store.save(self.username, self.client.get_settings())
+    
+    def login(self, force: bool = False):
+        """
+        Login using, in order: the pooled client, the saved session file,
+        the IG_SESSION secret, then username/password.
+        Sessions are not verified here - a rejected session is detected
+        lazily by post(), which skips it and forces a re-login with the
+        next source.
+        """
+        if not force and self._session_is_fresh():
+            return
+        
+        sessions = []
+        if self.username and "saved session" not in self.rejected:
+            saved = self.store.load(self.username)
+            if saved:
+                sessions.append(("saved session", saved))
         session_data = os.environ.get("IG_SESSION")
+        if session_data and "IG_SESSION" not in self.rejected:
+            sessions.append(("IG_SESSION", session_data))
         
-        # Method 1: Use pre-created session (RECOMMENDED)
-        if session_data:
+        # Method 1: Reuse a session (RECOMMENDED)
+        for source, session in sessions:
             try:
-                print("🔐 Attempting login with saved session...")
-                session = json.loads(session_data)
+                print(f"🔐 Attempting login with {source}...")
+                if isinstance(session, str):
+                    session = json.loads(session)
                 self.client.set_settings(session)
-                self.client.login(username, password)
-                
-                # Verify session works
-                self.client.get_timeline_feed()
-                print("✅ Logged in using saved session!")
+                self.client.login(self.username, self.password)
+                self._on_login(source)
+                print(f"✅ Logged in using {source}!")
                 return
                 
             except Exception as e:
                 print(f"⚠️ Session login failed: {e}")
-                print("   Trying username/password...")
         
         # Method 2: Direct login (may fail on datacenter IPs)
-        if not username or not password:
+        if not self.username or not self.password:
             raise ValueError(
                 "Missing credentials! Set IG_USERNAME, IG_PASSWORD, "
                 "and ideally IG_SESSION environment variables."
@@ -69,7 +118,8 @@ class InstagramPoster:
         
         try:
             print("🔐 Attempting direct login...")
-            self.client.login(username, password)
+            self.client.login(self.username, self.password, relogin=force)
+            self._on_login("direct login", persist=True)
             print("✅ Direct login successful!")
             
         except Exception as e:
@@ -87,11 +137,29 @@ class InstagramPoster:
         # Add hashtags
         full_caption = f"{caption}\n\n{HASHTAGS}"
         
-        # Upload
-        media = self.client.photo_upload(
-            path=str(image_path),
-            caption=full_caption
-        )
+        # Upload - the session is only re-checked if Instagram rejects it
+        while True:
+            try:
+                media = self.client.photo_upload(
+                    path=str(image_path),
+                    caption=full_caption
+                )
+                break
+            except LoginRequired:
+                source = _SESSION_SOURCE.get(self.account)
+                if source == "direct login":
+                    raise
+                
+                # Drop only the rejected session, then try the next source
+                print(f"⚠️ {source} rejected, logging in again...")
+                self.rejected.add(source)
+                if source == "saved session":
+                    self.store.clear(self.username)
+                self.login(force=True)
+        
+        # Keep the cookies Instagram refreshed during the upload
+        if self.username:
+            self.store.save(self.username, self.client.get_settings())
         
         print(f"🎉 Posted successfully! Media ID: {media.pk}")
         return media.pk
@@ -99,8 +167,6 @@ class InstagramPoster:
     def post_with_retry(self, image_path: Path, caption: str, 
                         max_retries: int = 3) -> str:
         """Post with automatic retry on failure"""
-        import time
-        
         for attempt in range(max_retries):
             try:
                 return self.post(image_path, caption)
@@ -12,6 +12,7 @@ from src.content_manager import ContentManager
 from src.image_generator import ImageGenerator
 from src.instagram_graph_api import InstagramGraphAPI
 from src.image_uploader import GitHubImageUploader
+from src.pipeline import BackfillPipeline
 from config import HASHTAGS
 
 
@@ -75,6 +76,44 @@ def run_daily_post(dry_run: bool = False):
     return True
 
 
+def run_backfill(limit: int = None, dry_run: bool = False):
+    """
+    Rattrape les jours manqués via le pipeline render/upload/publish
+    """
+    print("=" * 50)
+    print("🚀 Rattrapage des publications manquées...")
+    print("=" * 50)
+    
+    content_mgr = ContentManager()
+    quotes = content_mgr.get_backlog(limit)
+    
+    if not quotes:
+        print("✅ Rien à rattraper!")
+        return True
+    
+    print(f"📋 {len(quotes)} citation(s) à publier")
+    
+    if dry_run:
+        print("🧪 MODE TEST - Upload et publication ignorés")
+        pipeline = BackfillPipeline(ImageGenerator())
+        stats = pipeline.run(quotes)
+        return stats["failed"] is None
+    
+    pipeline = BackfillPipeline(
+        ImageGenerator(),
+        uploader=GitHubImageUploader(),
+        instagram=InstagramGraphAPI(),
+    )
+    
+    # Marquer au fil de l'eau: un arrêt en cours de route garde l'acquis
+    stats = pipeline.run(quotes, on_done=lambda item: content_mgr.mark_as_posted(item["index"]))
+    
+    stats_cm = content_mgr.get_stats()
+    print(f"📊 Progression: {stats_cm['posted']}/{stats_cm['total']} publiées ({stats_cm['progress']})")
+    
+    return stats["failed"] is None
+
+
 if __name__ == "__main__":
     import argparse
     
@@ -85,5 +124,17 @@ if __name__ == "__main__":
         help="Générer l'image sans publier"
     )
     
+    parser.add_argument(
+        "--backfill",
+        nargs="?",
+        type=int,
+        const=-1,
+        metavar="N",
+        help="Publier les citations manquées (toutes, ou les N plus anciennes)"
+    )
+    
     args = parser.parse_args()
-    run_daily_post(dry_run=args.dry_run)
\ No newline at end of file
+    if args.backfill is not None:
+        run_backfill(limit=None if args.backfill < 0 else args.backfill, dry_run=args.dry_run)
+    else:
+        run_daily_post(dry_run=args.dry_run)
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+Pipelined backfill: render -> upload -> container -> publish
+Each stage runs in its own thread with bounded queues in between, so
+quote N+1 renders while quote N uploads and quote N-1 is processed
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config import HASHTAGS
+from instagram_graph_api import PROCESSING_WAIT
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+class Stage(threading.Thread):
+    def __init__(self, name: str, func, inbox: queue.Queue, outbox: queue.Queue,
+                 position: int, failures: list, max_retries: int = 1):
+        super().__init__(name=name, daemon=True)
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.position = position
+        self.failures = failures
+        self.max_retries = max_retries
+        self.busy = 0.0
+        self.processed = 0
+        self.error = None
+
+    def _call(self, item: dict) -> dict:
+        """Run the stage function with the same retry policy as the API clients"""
+        for attempt in range(self.max_retries):
+            try:
+                return self.func(item)
+            except Exception as e:
+                print(f"❌ [{self.name}] Attempt {attempt + 1} failed: {e}")
+                if attempt < self.max_retries - 1:
+                    wait_time = (attempt + 1) * 10
+                    print(f"⏳ [{self.name}] Waiting {wait_time}s before retry...")
+                    time.sleep(wait_time)
+                else:
+                    raise
+
+    def run(self):
+        while True:
+            item = self.inbox.get()
+            if item is _DONE:
+                self.outbox.put(_DONE)
+                return
+
+            # After a failure, the failing stage and those before it drain
+            # without working so later quotes are never published ahead of
+            # the one that failed. Stages after it keep going: what they
+            # hold are earlier quotes, already past the failure.
+            if self.failures and self.position <= max(self.failures):
+                continue
+
+            started = time.perf_counter()
+            try:
+                result = self._call(item)
+            except Exception as e:
+                self.error = (item, e)
+                self.failures.append(self.position)
+                continue
+            finally:
+                self.busy += time.perf_counter() - started
+
+            self.processed += 1
+            self.outbox.put(result)
+
+
+class BackfillPipeline:
+    def __init__(self, generator, uploader=None, instagram=None,
+                 queue_size: int = 2, max_retries: int = 3):
+        """
+        Args:
+            generator: ImageGenerator
+            uploader: GitHubImageUploader (None = dry run, render only)
+            instagram: InstagramGraphAPI (None = dry run, render only)
+            queue_size: Max items waiting between two stages
+            max_retries: Attempts per network call
+        """
+        self.generator = generator
+        self.uploader = uploader
+        self.instagram = instagram
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+
+    # === STAGES ===
+
+    def _render(self, item: dict) -> dict:
+        item["image_path"] = self.generator.generate(
+            quote_text=item["content"],
+            quote_date=item["date"]
+        )
+        return item
+
+    def _upload(self, item: dict) -> dict:
+        item["image_url"] = self.uploader.upload(item["image_path"])
+        return item
+
+    def _create_container(self, item: dict) -> dict:
+        caption = f"💡 {item['content']}\n\n{HASHTAGS}"
+        item["creation_id"] = self.instagram.create_container(item["image_url"], caption)
+        item["created_at"] = time.monotonic()
+        return item
+
+    def _publish(self, item: dict) -> dict:
+        # Only wait for what is left of the processing time
+        remaining = PROCESSING_WAIT - (time.monotonic() - item["created_at"])
+        if remaining > 0:
+            time.sleep(remaining)
+
+        item["media_id"] = self.instagram.publish_container(item["creation_id"])
+        return item
+
+    # === RUN ===
+
+    def run(self, quotes: list, on_done=None) -> dict:
+        """
+        Push every quote through the pipeline, in order
+
+        Args:
+            quotes: Dicts with date, content, index (ContentManager format)
+            on_done: Called in the caller's thread for each finished quote
+
+        Returns:
+            Stats: done, failed, elapsed, throughput and per-stage utilization
+        """
+        steps = [("render", self._render, 1)]
+        if self.uploader is not None and self.instagram is not None:
+            steps += [
+                ("upload", self._upload, self.max_retries),
+                ("container", self._create_container, self.max_retries),
+                ("publish", self._publish, self.max_retries),
+            ]
+
+        failures = []  # Positions of the stages that failed
+        source = queue.Queue()
+        for quote in quotes:
+            source.put(dict(quote))
+        source.put(_DONE)
+
+        # Bounded queues between stages, unbounded at both ends
+        stages = []
+        inbox = source
+        for i, (name, func, retries) in enumerate(steps):
+            last = i == len(steps) - 1
+            outbox = queue.Queue() if last else queue.Queue(maxsize=self.queue_size)
+            stages.append(Stage(name, func, inbox, outbox, i, failures, retries))
+            inbox = outbox
+        sink = inbox
+
+        started = time.perf_counter()
+        for stage in stages:
+            stage.start()
+
+        done = []
+        while True:
+            item = sink.get()
+            if item is _DONE:
+                break
+            done.append(item)
+            if on_done is not None:
+                on_done(item)
+
+        for stage in stages:
+            stage.join()
+        elapsed = time.perf_counter() - started
+
+        # The furthest stage to fail holds the earliest quote that failed
+        errors = [stage.error for stage in stages if stage.error is not None]
+        stats = {
+            "done": len(done),
+            "failed": errors[-1][0] if errors else None,
+            "error": errors[-1][1] if errors else None,
+            "elapsed": elapsed,
+            "throughput": len(done) / elapsed * 60 if elapsed else 0.0,
+            "utilization": {
+                stage.name: stage.busy / elapsed if elapsed else 0.0
+                for stage in stages
+            },
+        }
+        self._report(stats, len(quotes))
+        return stats
+
+    @staticmethod
+    def _report(stats: dict, total: int):
+        print("\n" + "=" * 50)
+        print(f"📦 Backfill: {stats['done']}/{total} en {stats['elapsed']:.1f}s "
+              f"({stats['throughput']:.1f} publications/min)")
+        for name, utilization in stats["utilization"].items():
+            bar = "█" * round(utilization * 20)
+            print(f"   {name:<10} {bar:<20} {utilization:.0%}")
+        if stats["failed"] is not None:
+            print(f"❌ Arrêt sur la citation {stats['failed']['index']}: {stats['error']}")
+        print("=" * 50)
+
+
+if __name__ == "__main__":
+    # Check: an upload failure must not drop the quotes already past it
+    from datetime import date
+
+    PROCESSING_WAIT = 0
+
+    class FakeGenerator:
+        def generate(self, quote_text, quote_date):
+            return f"output/{quote_date}.png"
+
+    class FakeUploader:
+        def upload(self, image_path):
+            if image_path.endswith("03.png"):
+                raise RuntimeError("upload refusé")
+            return f"https://example.com/{image_path}"
+
+    class FakeInstagram:
+        def create_container(self, image_url, caption):
+            time.sleep(0.2)  # Garde les citations 1-2 en vol pendant l'échec
+            return image_url
+
+        def publish_container(self, creation_id):
+            return creation_id
+
+    quotes = [
+        {"index": i, "date": date(2026, 1, i), "content": f"citation {i}"}
+        for i in range(1, 6)
+    ]
+    published = []
+    pipeline = BackfillPipeline(FakeGenerator(), FakeUploader(), FakeInstagram(), max_retries=1)
+    stats = pipeline.run(quotes, on_done=lambda item: published.append(item["index"]))
+
+    assert published == [1, 2], published
+    assert stats["failed"]["index"] == 3, stats["failed"]
+    print("✅ Les citations avant l'échec sont bien publiées")
@@ -0,0 +1,165 @@
+"""
+Génère des Reels/Stories animés à partir d'une citation
+Le texte est rastérisé une seule fois, les images sont synthétisées
+par mélange alpha NumPy et envoyées en flux à ffmpeg
+"""
+
+import shutil
+import subprocess
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import sys
+sys.path.append(str(Path(__file__).parent.parent))
+from config import OUTPUT_DIR, REEL_CONFIG
+from image_generator import ImageGenerator
+
+
+class ReelGenerator:
+    def __init__(self, generator: ImageGenerator = None, ffmpeg: str = "ffmpeg"):
+        self.generator = generator or ImageGenerator()
+        self.renderer = self.generator.renderer
+        self.config = REEL_CONFIG
+        self.ffmpeg = ffmpeg
+
+    def _sprites(self, quote_text: str, quote_date: date) -> list:
+        """
+        Rastérise date + lignes de la citation, une fois pour toute la vidéo
+
+        Returns:
+            Liste de (rgb float32, alpha float32, (x, y, x2, y2), début)
+        """
+        config = self.config
+        blocks = [(*self.generator._date_block(quote_date), config["start"])]
+
+        quote_style = self.generator.quote_config
+        padding = self.renderer.padding_for(quote_style)
+        first_line = config["start"] + config["fade"]
+        for i, placed in enumerate(self.generator._layout_quote(quote_text)):
+            mask, origin = self.renderer.rasterize(
+                [placed], self.generator.font_quote, padding=padding
+            )
+            blocks.append((mask, origin, quote_style, first_line + i * config["line_delay"]))
+
+        sprites = []
+        for mask, (x, y), style, start in blocks:
+            flat = np.asarray(self.renderer.flatten(mask, style), dtype=np.float32) / 255
+            sprites.append((
+                flat[..., :3] * 255,
+                flat[..., 3:],
+                (x, y, x + mask.width, y + mask.height),
+                start,
+            ))
+        return sprites
+
+    def frames(self, quote_text: str, quote_date: date):
+        """
+        Génère les images RGB uint8 une par une (jamais toute la vidéo en mémoire)
+        Chaque image n'est valable que jusqu'à la suivante (tampon réutilisé).
+
+        Les éléments entièrement apparus sont fixés dans le fond, seuls
+        ceux en cours de fondu sont recalculés à chaque image.
+        """
+        config = self.config
+        base = np.array(Image.open(self.generator.template_path).convert("RGB"))
+        pending = self._sprites(quote_text, quote_date)
+
+        # Assez long pour révéler toutes les lignes, "duration" au minimum
+        last_start = max(sprite[3] for sprite in pending)
+        duration = max(config["duration"], last_start + config["fade"] + config["hold"])
+
+        for n in range(round(duration * config["fps"])):
+            t = n / config["fps"]
+            frame = base
+            active = []
+
+            for sprite in list(pending):
+                progress = (t - sprite[3]) / config["fade"]
+                if progress >= 1:
+                    # Fondu terminé: on l'intègre au fond une fois pour toutes
+                    self._blend(base, sprite, 1.0)
+                    pending.remove(sprite)
+                elif progress > 0:
+                    active.append((sprite, progress))
+
+            if active:
+                frame = base.copy()
+                for sprite, progress in active:
+                    self._blend(frame, sprite, progress)
+
+            yield frame
+
+    @staticmethod
+    def _blend(frame: np.ndarray, sprite: tuple, opacity: float):
+        """frame = frame * (1 - a) + rgb * a sur la zone du sprite (en place)"""
+        rgb, alpha, (x, y, x2, y2), _ = sprite
+        height, width = frame.shape[:2]
+        left, top = max(0, -x), max(0, -y)
+        right = rgb.shape[1] - max(0, x2 - width)
+        bottom = rgb.shape[0] - max(0, y2 - height)
+        if right <= left or bottom <= top:
+            return  # Entièrement hors de l'image
+
+        region = frame[y + top:y + bottom, x + left:x + right]
+        a = alpha[top:bottom, left:right] * opacity
+        blended = region * (1 - a) + rgb[top:bottom, left:right] * a
+        region[...] = np.rint(blended).astype(np.uint8)
+
+    def generate(self, quote_text: str, quote_date: date,
+                 output_filename: str = None) -> Path:
+        """
+        Encode la vidéo en MP4 (H.264) via ffmpeg
+        """
+        if shutil.which(self.ffmpeg) is None:
+            raise RuntimeError(f"ffmpeg introuvable ({self.ffmpeg}) - installez-le pour les Reels")
+
+        print(f"🎬 Reel: {quote_text[:50]}...")
+        config = self.config
+
+        if output_filename is None:
+            output_filename = f"reel_{quote_date.strftime('%Y%m%d')}.mp4"
+        output_path = OUTPUT_DIR / output_filename
+        OUTPUT_DIR.mkdir(exist_ok=True)
+
+        width, height = Image.open(self.generator.template_path).size
+        encoder = subprocess.Popen(
+            [
+                self.ffmpeg, "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgb24",
+                "-s", f"{width}x{height}", "-r", str(config["fps"]),
+                "-i", "-",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p",
+                "-crf", str(config["crf"]), "-movflags", "+faststart",
+                str(output_path),
+            ],
+            stdin=subprocess.PIPE,
+        )
+
+        started = time.perf_counter()
+        count = 0
+        try:
+            for frame in self.frames(quote_text, quote_date):
+                encoder.stdin.write(frame.tobytes())
+                count += 1
+        finally:
+            encoder.stdin.close()
+            returncode = encoder.wait()
+
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg a échoué (code {returncode})")
+
+        elapsed = time.perf_counter() - started
+        print(f"🎞️  {count} images en {elapsed:.1f}s ({count / elapsed:.0f} images/s)")
+        print(f"🎥 Reel généré: {output_path}")
+
+        return output_path
+
+
+if __name__ == "__main__":
+    reel = ReelGenerator()
+    test_quote = "خمس عبارات يحب الزوج سمعها من زوجته أنت وسيم بوجودك بحياتي"
+    reel.generate(quote_text=test_quote, quote_date=date(2026, 1, 19))
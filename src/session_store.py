@@ -0,0 +1,61 @@
+"""
+Persistent instagrapi sessions
+One JSON file per account, reused while younger than the TTL
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config import SESSIONS_DIR, SESSION_TTL
+
+
+class SessionStore:
+    def __init__(self, sessions_dir: Path = SESSIONS_DIR, ttl: int = SESSION_TTL):
+        self.sessions_dir = sessions_dir
+        self.ttl = ttl
+
+    def _path(self, username: str) -> Path:
+        return self.sessions_dir / f"{username}.json"
+
+    def load(self, username: str) -> dict | None:
+        """
+        Load saved settings for an account
+
+        Returns:
+            instagrapi settings, or None if missing, unreadable or expired
+        """
+        path = self._path(username)
+        if not path.exists():
+            return None
+
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring unreadable session file: {e}")
+            return None
+
+        age = time.time() - data.get("saved_at", 0)
+        if age > self.ttl:
+            print(f"⌛ Saved session expired ({age / 3600:.1f}h old)")
+            return None
+
+        return data["settings"]
+
+    def save(self, username: str, settings: dict):
+        """Write settings atomically, readable by the owner only"""
+        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(username)
+        tmp = path.with_suffix(".tmp")
+
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "settings": settings}, f)
+        os.replace(tmp, path)
+
+    def clear(self, username: str):
+        """Forget a session that Instagram rejected"""
+        self._path(username).unlink(missing_ok=True)
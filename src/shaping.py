@@ -0,0 +1,94 @@
+"""
+Backends de mise en forme du texte arabe (shaping)
+- raqm: Pillow met en forme et ordonne le texte lui-même (libraqm)
+- arabic_reshaper: formes de présentation + ordre visuel (python-bidi)
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from PIL import ImageFont, features
+import sys
+
+try:
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+except ImportError:
+    arabic_reshaper = None
+
+sys.path.append(str(Path(__file__).parent.parent))
+from config import SHAPING_BACKEND
+
+
+class ShapingBackend(ABC):
+    """Interface: texte logique -> texte à passer à Pillow"""
+    name = ""
+    layout_engine = None
+
+    @classmethod
+    @abstractmethod
+    def available(cls) -> bool:
+        """Le backend peut-il tourner sur cette machine?"""
+
+    @abstractmethod
+    def shape(self, text: str) -> str:
+        """Prépare une ligne pour le moteur de mise en page du backend"""
+
+    def font(self, path: Path, size: int) -> ImageFont.FreeTypeFont:
+        """Charge la police avec le moteur de mise en page du backend"""
+        return ImageFont.truetype(str(path), size, layout_engine=self.layout_engine)
+
+
+class RaqmBackend(ShapingBackend):
+    name = "raqm"
+    layout_engine = ImageFont.Layout.RAQM
+
+    @classmethod
+    def available(cls) -> bool:
+        return bool(features.check("raqm"))
+
+    def shape(self, text: str) -> str:
+        # HarfBuzz + FriBiDi s'occupent de tout pendant le rendu
+        return text
+
+
+class ReshaperBackend(ShapingBackend):
+    name = "arabic_reshaper"
+    layout_engine = ImageFont.Layout.BASIC
+
+    @classmethod
+    def available(cls) -> bool:
+        return arabic_reshaper is not None
+
+    def shape(self, text: str) -> str:
+        # Le moteur BASIC dessine de gauche à droite: il faut l'ordre visuel
+        return get_display(arabic_reshaper.reshape(text))
+
+
+# Ordre de préférence pour "auto"
+BACKENDS = {
+    RaqmBackend.name: RaqmBackend,
+    ReshaperBackend.name: ReshaperBackend,
+}
+
+
+def get_backend(name: str = SHAPING_BACKEND) -> ShapingBackend:
+    """
+    Retourne le backend demandé, ou le premier disponible si name == "auto"
+    """
+    if name == "auto":
+        for backend in BACKENDS.values():
+            if backend.available():
+                return backend()
+        raise ImportError(
+            "Aucun moteur arabe disponible!\n"
+            "Installez: pip install arabic-reshaper python-bidi\n"
+            "ou une version de Pillow compilée avec libraqm"
+        )
+
+    if name not in BACKENDS:
+        raise ValueError(f"Backend inconnu: {name} (choix: auto, {', '.join(BACKENDS)})")
+
+    backend = BACKENDS[name]
+    if not backend.available():
+        raise ImportError(f"Backend {name} indisponible sur cette machine")
+    return backend()
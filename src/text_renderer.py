@@ -0,0 +1,126 @@
+"""
+Rendu du texte par calques (masque alpha unique)
+Chaque bloc de texte est rastérisé une seule fois, ombre et contour
+sont dérivés du masque puis composés sur le template en une passe
+"""
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+
+class TextRenderer:
+    def rasterize(self, lines: list, font: ImageFont.FreeTypeFont,
+                  padding: int = 0) -> tuple:
+        """
+        Rastérise des lignes déjà placées dans un masque "L"
+
+        Args:
+            lines: Liste de (texte, (x, y)) en coordonnées du template
+            font: Police utilisée pour toutes les lignes
+            padding: Marge autour du texte (ombre, flou, contour)
+
+        Returns:
+            (masque, (x, y)) - le masque et son coin haut-gauche,
+            ou None s'il n'y a aucune ligne
+        """
+        if not lines:
+            return None
+
+        boxes = []
+        for text, (x, y) in lines:
+            left, top, right, bottom = font.getbbox(text)
+            boxes.append((x + left, y + top, x + right, y + bottom))
+
+        x0 = min(b[0] for b in boxes) - padding
+        y0 = min(b[1] for b in boxes) - padding
+        x1 = max(b[2] for b in boxes) + padding
+        y1 = max(b[3] for b in boxes) + padding
+
+        mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+        draw = ImageDraw.Draw(mask)
+        for text, (x, y) in lines:
+            draw.text((x - x0, y - y0), text, font=font, fill=255)
+
+        return mask, (x0, y0)
+
+    @staticmethod
+    def padding_for(style: dict) -> int:
+        """Marge nécessaire pour que les effets ne soient pas coupés"""
+        shadow = 0
+        if style.get("shadow_color"):
+            shadow = abs(style.get("shadow_offset", 0)) + 3 * style.get("shadow_blur", 0)
+        outline = style.get("outline_width", 0) if style.get("outline_color") else 0
+        return max(shadow, outline)
+
+    def layers(self, mask: Image.Image, style: dict) -> list:
+        """
+        Dérive les calques actifs depuis le masque du texte
+
+        Returns:
+            Liste de (couleur, masque, (dx, dy)) du fond vers le dessus
+        """
+        result = []
+
+        # Ombre: décalage + flou optionnel
+        if style.get("shadow_color"):
+            shadow = mask
+            if style.get("shadow_blur"):
+                shadow = shadow.filter(ImageFilter.GaussianBlur(style["shadow_blur"]))
+            offset = style.get("shadow_offset", 0)
+            result.append((style["shadow_color"], shadow, (offset, offset)))
+
+        # Contour: dilatation du masque
+        width = style.get("outline_width", 0)
+        if style.get("outline_color") and width > 0:
+            outline = mask.filter(ImageFilter.MaxFilter(2 * width + 1))
+            result.append((style["outline_color"], outline, (0, 0)))
+
+        result.append((style["color"], mask, (0, 0)))
+        return result
+
+    def flatten(self, mask: Image.Image, style: dict) -> Image.Image:
+        """
+        Empile les calques d'un bloc dans une image RGBA de la taille du masque
+        (la marge du masque contient déjà le décalage de l'ombre)
+        """
+        flat = Image.new("RGBA", mask.size, (0, 0, 0, 0))
+        for color, layer_mask, offset in self.layers(mask, style):
+            layer = Image.new("RGBA", layer_mask.size, color)
+            layer.putalpha(layer_mask)
+            self._paste_layer(flat, layer, offset)
+        return flat
+
+    def composite(self, img: Image.Image, blocks: list) -> Image.Image:
+        """
+        Compose tous les blocs sur l'image en une seule passe
+
+        Args:
+            img: Template (n'importe quel mode)
+            blocks: Liste de (masque, (x, y), style) - les None sont ignorés
+
+        Returns:
+            Nouvelle image dans le mode d'origine
+        """
+        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
+
+        for block in blocks:
+            if block is None:
+                continue
+            mask, origin, style = block
+            self._paste_layer(overlay, self.flatten(mask, style), origin)
+
+        mode = img.mode
+        result = Image.alpha_composite(img.convert("RGBA"), overlay)
+        return result if mode == "RGBA" else result.convert(mode)
+
+    @staticmethod
+    def _paste_layer(overlay: Image.Image, layer: Image.Image, dest: tuple):
+        """alpha_composite en découpant ce qui dépasse du template"""
+        x, y = dest
+        left, top = max(0, -x), max(0, -y)
+        right = min(layer.width, overlay.width - x)
+        bottom = min(layer.height, overlay.height - y)
+        if right <= left or bottom <= top:
+            return
+        overlay.alpha_composite(
+            layer, dest=(x + left, y + top), source=(left, top, right, bottom)
+        )
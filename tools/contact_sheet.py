@@ -0,0 +1,156 @@
+# tools/contact_sheet.py
+"""
+Renders thumbnails of upcoming quotes in parallel and tiles them into
+paginated contact sheets, with the layout boxes drawn on top
+"""
+
+import contextlib
+import io
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+from position_helper import draw_grid
+
+# Per-process generator, created once by _init_worker
+_generator = None
+
+
+def _init_worker():
+    global _generator
+    with contextlib.redirect_stdout(io.StringIO()):
+        from image_generator import ImageGenerator
+        _generator = ImageGenerator(use_date_cache=True)
+
+
+def _render_thumbnail(task: tuple) -> tuple:
+    """Renders one quote at thumbnail scale and returns (index, thumbnail)"""
+    index, quote_text, quote_date, thumb_size, grid = task
+    width, height = Image.open(_generator.template_path).size
+    scale = thumb_size / max(width, height)
+
+    # The generator logs every line - keep worker output quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        blocks = _generator.layout(quote_text, quote_date)
+        img = _generator.render(quote_text, quote_date, blocks, scale=scale)
+
+    img = img.convert("RGB")
+    draw = ImageDraw.Draw(img)
+    if grid:
+        draw_grid(draw, img.size, step=max(1, round(100 * scale)), labels=False)
+
+    # Layout boxes: quote in red, date in blue
+    for block, color in zip(blocks, ("red", "blue")):
+        if block is None:
+            continue
+        mask, (x, y), _ = block
+        box = [round(v * scale) for v in (x, y, x + mask.width, y + mask.height)]
+        draw.rectangle(box, outline=color, width=1)
+
+    return index, img
+
+
+def create_contact_sheets(count: int = 30, include_all: bool = False,
+                          cols: int = 6, rows: int = 5, thumb_size: int = 216,
+                          workers: int = None, grid: bool = False,
+                          output_dir: str = "output/contact_sheets") -> list:
+    """Renders the next `count` unposted quotes (or all) into contact sheets"""
+    from content_manager import ContentManager
+    from image_generator import ImageGenerator
+
+    df = ContentManager().df
+    if not include_all:
+        df = df[df["posted"] == False].head(count)
+
+    tasks = [
+        (index, row["content"], row["date"], thumb_size, grid)
+        for index, row in df.iterrows()
+    ]
+    labels = {
+        index: f"#{index}  {row['date']}" + ("  (posted)" if row["posted"] else "")
+        for index, row in df.iterrows()
+    }
+    if not tasks:
+        print("❌ No quotes to preview")
+        return []
+
+    # Build the date sprites once here instead of racing in every worker
+    with contextlib.redirect_stdout(io.StringIO()):
+        cache = ImageGenerator(use_date_cache=True).date_cache
+    for year in sorted({task[2].year for task in tasks}):
+        cache.warm(year)
+
+    started = time.perf_counter()
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        chunksize = max(1, len(tasks) // (workers * 4))
+        thumbnails = dict(pool.map(_render_thumbnail, tasks, chunksize=chunksize))
+    elapsed = time.perf_counter() - started
+
+    # Tile into pages
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    label_height = 24
+    per_page = cols * rows
+    pages = math.ceil(len(tasks) / per_page)
+    paths = []
+
+    for page in range(pages):
+        page_tasks = tasks[page * per_page:(page + 1) * per_page]
+        sheet = Image.new(
+            "RGB", (cols * thumb_size, rows * (thumb_size + label_height)), "white"
+        )
+        draw = ImageDraw.Draw(sheet)
+
+        for slot, task in enumerate(page_tasks):
+            index = task[0]
+            x = (slot % cols) * thumb_size
+            y = (slot // cols) * (thumb_size + label_height)
+            sheet.paste(thumbnails[index], (x, y))
+            draw.text((x + 5, y + thumb_size + 5), labels[index], fill="black")
+
+        path = output_dir / f"sheet_{page + 1:03d}.png"
+        sheet.save(path)
+        paths.append(path)
+
+    print(f"""
+╔══════════════════════════════════════════════════════╗
+║            🗂️  CONTACT SHEETS GENERATED               ║
+╠══════════════════════════════════════════════════════╣
+║  Quotes: {len(tasks)} in {elapsed:.1f}s ({len(tasks) / elapsed:.0f}/s, {workers} workers)
+║  Pages: {pages} ({cols} x {rows})
+║  Boxes: red = quote, blue = date
+║
+║  Saved to: {output_dir}
+╚══════════════════════════════════════════════════════╝
+    """)
+
+    return paths
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Contact sheet preview of upcoming quotes")
+    parser.add_argument("-n", "--count", type=int, default=30, help="Number of unposted quotes")
+    parser.add_argument("--all", action="store_true", help="Preview the whole library")
+    parser.add_argument("--cols", type=int, default=6)
+    parser.add_argument("--rows", type=int, default=5)
+    parser.add_argument("--thumb", type=int, default=216, help="Thumbnail size in pixels")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--grid", action="store_true", help="Overlay the position grid")
+    parser.add_argument("--output", default="output/contact_sheets")
+
+    args = parser.parse_args()
+    create_contact_sheets(
+        count=args.count, include_all=args.all, cols=args.cols, rows=args.rows,
+        thumb_size=args.thumb, workers=args.workers, grid=args.grid,
+        output_dir=args.output,
+    )
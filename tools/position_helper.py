@@ -6,25 +6,34 @@ Run this to find the right coordinates for your template
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
-def create_position_guide(template_path: str, output_path: str = "position_guide.png"):
-    """Creates a visual grid to help position text"""
-    
-    img = Image.open(template_path)
-    draw = ImageDraw.Draw(img)
-    width, height = img.size
+def draw_grid(draw: ImageDraw.ImageDraw, size: tuple, step: int = 100,
+              labels: bool = True):
+    """Draws a grid every `step` pixels (red every 500)"""
+    width, height = size
     
-    # Draw grid every 100 pixels
-    for x in range(0, width, 100):
+    for x in range(0, width, step):
         # Vertical lines
         color = "red" if x % 500 == 0 else "gray"
         draw.line([(x, 0), (x, height)], fill=color, width=1)
-        draw.text((x + 5, 10), str(x), fill="red")
+        if labels:
+            draw.text((x + 5, 10), str(x), fill="red")
     
-    for y in range(0, height, 100):
+    for y in range(0, height, step):
         # Horizontal lines
         color = "red" if y % 500 == 0 else "gray"
         draw.line([(0, y), (width, y)], fill=color, width=1)
-        draw.text((10, y + 5), str(y), fill="red")
+        if labels:
+            draw.text((10, y + 5), str(y), fill="red")
+
+
+def create_position_guide(template_path: str, output_path: str = "position_guide.png"):
+    """Creates a visual grid to help position text"""
+    
+    img = Image.open(template_path)
+    draw = ImageDraw.Draw(img)
+    width, height = img.size
+    
+    draw_grid(draw, img.size)
     
     # Mark center
     center_x, center_y = width // 2, height // 2
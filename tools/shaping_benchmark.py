@@ -0,0 +1,107 @@
+# tools/shaping_benchmark.py
+"""
+Compares the Arabic shaping backends on the quote library:
+per-line shaping/rendering cost, and whether their outputs match
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from config import FONT_QUOTE, TEXT_CONFIG
+from shaping import BACKENDS, ReshaperBackend
+
+
+def _render_line(backend, font, line: str) -> Image.Image:
+    """Shape, measure and rasterize one line, like ImageGenerator does"""
+    text = backend.shape(line)
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return mask
+
+
+def _difference(a: Image.Image, b: Image.Image) -> float:
+    """Mean absolute pixel difference (0-255) once both are the same size"""
+    if a.size != b.size:
+        b = b.resize(a.size, Image.LANCZOS)
+    return float(np.abs(np.asarray(a, dtype=np.int16) - np.asarray(b, dtype=np.int16)).mean())
+
+
+def run_benchmark(repeats: int = 5, tolerance: float = 8.0, max_size_delta: int = 3):
+    from content_manager import ContentManager
+    from image_generator import ImageGenerator
+
+    # Same line breaks as production
+    lines = [
+        line
+        for content in ContentManager().df["content"]
+        for line in ImageGenerator._wrap_text_simple(content, max_chars=40)
+    ]
+    print(f"📏 {len(lines)} lines, {repeats} passes per backend\n")
+
+    results = {}
+    for name, backend_class in BACKENDS.items():
+        if not backend_class.available():
+            print(f"⏭️  {name}: not available on this machine")
+            continue
+
+        backend = backend_class()
+        font = backend.font(FONT_QUOTE, TEXT_CONFIG["quote"]["font_size"])
+
+        started = time.perf_counter()
+        for _ in range(repeats):
+            masks = [_render_line(backend, font, line) for line in lines]
+        elapsed = time.perf_counter() - started
+
+        per_line = elapsed / (repeats * len(lines)) * 1e6
+        results[name] = (per_line, masks)
+        print(f"⏱️  {name}: {per_line:.0f} µs/line")
+
+    if len(results) < 2:
+        print("\nℹ️  Only one backend available - nothing to compare")
+        return results
+
+    # Compare every backend to the long-standing arabic_reshaper path
+    reference = ReshaperBackend.name if ReshaperBackend.name in results else next(iter(results))
+    print(f"\n🔎 Reference: {reference}")
+
+    correct = [reference]
+    for name, (per_line, masks) in results.items():
+        if name == reference:
+            continue
+        mismatches = []
+        for line, a, b in zip(lines, results[reference][1], masks):
+            size_delta = max(abs(a.width - b.width), abs(a.height - b.height))
+            diff = _difference(a, b)
+            if size_delta > max_size_delta or diff > tolerance:
+                mismatches.append((line, size_delta, diff))
+
+        speedup = results[reference][0] / per_line
+        status = "✅ outputs match" if not mismatches else f"❌ {len(mismatches)} lines differ"
+        print(f"   {name}: {speedup:.2f}x vs reference, {status}")
+        for line, size_delta, diff in mismatches[:5]:
+            print(f"      '{line[:35]}...' (size Δ {size_delta}px, diff {diff:.1f})")
+        if not mismatches:
+            correct.append(name)
+
+    best = min(correct, key=lambda name: results[name][0])
+    print(f"\n🏁 Fastest correct backend: {best} (SHAPING_BACKEND = \"{best}\" in config.py)")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Arabic shaping backends")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=8.0,
+                        help="Max mean pixel difference (0-255) for a match")
+
+    args = parser.parse_args()
+    run_benchmark(repeats=args.repeats, tolerance=args.tolerance)